@@ -24,6 +24,8 @@
 #include "py_unicodeobject.h"
 
 #include <algorithm>
+#include <array>
+#include <cstdint>
 #include <string>
 
 #include <matxscript/runtime/container/unicode_view.h>
@@ -33,6 +35,21 @@ namespace runtime {
 
 class Unicode;
 
+// Classification flags for Latin-1 code points. The table turns the
+// per-character predicate calls in the hot split/strip loops into a single
+// indexed load; code points >= U+0100 fall through to the unicodetype db.
+enum UnicodeCharClass : uint8_t {
+  kUnicodeClassSpace = 1u << 0,
+  kUnicodeClassAlpha = 1u << 1,
+  kUnicodeClassDigit = 1u << 2,
+  kUnicodeClassPunct = 1u << 3,
+  kUnicodeClassControl = 1u << 4,
+};
+
+// built once at library load from the unicodetype db (see unicode_ops.cc),
+// so the fast path can never disagree with the slow path
+extern const std::array<uint8_t, 256> kLatin1CharClassTable;
+
 extern unicode_string py_unicode_do_upper(unicode_view input);
 extern unicode_string py_unicode_do_lower(unicode_view input);
 extern Unicode py_unicode_do_upper_optimize(unicode_view input);
@@ -47,6 +64,9 @@ inline bool py_unicode_isalpha(unicode_view input) noexcept {
 }
 
 inline bool py_unicode_isspace(Py_UCS4 c) noexcept {
+  if (c < 0x100) {
+    return kLatin1CharClassTable[c] & kUnicodeClassSpace;
+  }
   return _PyUnicode_IsWhitespace(c);
 }
 
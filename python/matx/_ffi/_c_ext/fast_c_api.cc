@@ -1156,7 +1156,15 @@ static PyObject* matx_script_api_op_kernel_call(PyObject* self, PyObject* args)
   }
 
   MATXScriptAny ret_val;
-  if (0 != MATXScriptPipelineOpKernelCall(op_kernel_ptr, item_buffer, success_args, 1, &ret_val)) {
+  int call_ret;
+  // the kernel only sees the converted MATXScriptAny values, so let other
+  // python threads run while it works; kernels that wrap a python callable
+  // (PythonBaseOp) re-enter through PythonClosureMATXScriptPackedCFunc,
+  // which re-acquires the GIL before touching any PyObject
+  Py_BEGIN_ALLOW_THREADS;
+  call_ret = MATXScriptPipelineOpKernelCall(op_kernel_ptr, item_buffer, success_args, 1, &ret_val);
+  Py_END_ALLOW_THREADS;
+  if (0 != call_ret) {
     PyErr_SetString(PyExc_TypeError, MATXScriptAPIGetLastError());
     goto RETURN_FLAG;
   }
@@ -1224,10 +1232,10 @@ static PyObject* matx_script_api_make_any(PyObject* self, PyObject* args) {
   return obj;
 }
 
-static int PythonClosureMATXScriptPackedCFunc(MATXScriptAny* args,
-                                              int num_args,
-                                              MATXScriptValueHandle ret,
-                                              void* resource_handle) {
+static int PythonClosureMATXScriptPackedCFuncImpl(MATXScriptAny* args,
+                                                  int num_args,
+                                                  MATXScriptValueHandle ret,
+                                                  void* resource_handle) {
   PyObject* py_func = (PyObject*)resource_handle;
   PyObject* py_args = PyTuple_New(num_args);
   if (!py_args) {
@@ -1268,9 +1276,24 @@ static int PythonClosureMATXScriptPackedCFunc(MATXScriptAny* args,
   return MATXScriptCFuncSetReturn(ret, &c_ret, 1);
 }
 
+static int PythonClosureMATXScriptPackedCFunc(MATXScriptAny* args,
+                                              int num_args,
+                                              MATXScriptValueHandle ret,
+                                              void* resource_handle) {
+  // the runtime may invoke this closure with the GIL released (e.g. an op
+  // kernel wrapping a python callable called via op_kernel_call) or from a
+  // native worker thread, so take the GIL before touching any PyObject
+  PyGILState_STATE gil_state = PyGILState_Ensure();
+  int func_ret = PythonClosureMATXScriptPackedCFuncImpl(args, num_args, ret, resource_handle);
+  PyGILState_Release(gil_state);
+  return func_ret;
+}
+
 static void PythonClosureMATXScriptPackedCFuncFinalizer(void* resource_handle) {
+  PyGILState_STATE gil_state = PyGILState_Ensure();
   PyObject* py_func = (PyObject*)resource_handle;
   Py_DECREF(py_func);
+  PyGILState_Release(gil_state);
 }
 
 static PyObject* matx_script_api_convert_to_packed_func(PyObject* self, PyObject* py_func) {
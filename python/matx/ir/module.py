@@ -19,6 +19,8 @@
 # specific language governing permissions and limitations
 # under the License.
 """IRModule that holds the functions and type definitions."""
+import functools
+
 from .._ffi.base import string_types
 from .. import _ffi
 
@@ -28,6 +30,40 @@ from . import type as _ty
 from . import _ffi_api
 from ._converter import to_ir_object as _to_ir
 
+# module-level aliases so hot paths can do exact type() checks without
+# walking the MRO; isinstance stays as the fallback for subclasses
+_HLOExpr = _expr.HLOExpr
+_GlobalVar = _expr.GlobalVar
+_Type = _ty.Type
+_GlobalTypeVar = _ty.GlobalTypeVar
+
+
+def _is_string(x):
+    return type(x) is str or isinstance(x, string_types)
+
+
+def _to_ir_fast(x):
+    # skip the converter dispatch when the caller already passes IR
+    return x if isinstance(x, Node) else _to_ir(x)
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_ir_str(name):
+    # global var names are drawn from a small set, so intern the IR string
+    # objects instead of constructing a fresh one per lookup
+    return _to_ir(name)
+
+
+# bind the packed funcs of the hot entry points once, so each call skips
+# the _ffi_api module attribute lookup
+_Module_Add = _ffi_api.Module_Add
+_Module_AddDef = _ffi_api.Module_AddDef
+_Module_ContainGlobalVar = _ffi_api.Module_ContainGlobalVar
+_Module_GetGlobalVar = _ffi_api.Module_GetGlobalVar
+_Module_Lookup = _ffi_api.Module_Lookup
+_Module_Lookup_str = _ffi_api.Module_Lookup_str
+_Module_LookupDef = _ffi_api.Module_LookupDef
+
 
 @_ffi.register_object("IRModule")
 class IRModule(Node):
@@ -46,25 +82,53 @@ class IRModule(Node):
     """
 
     def __init__(self, functions=None, type_definitions=None):
+        self._gv_cache = {}
+        self._gtv_cache = {}
         if functions is None:
             functions = {}
-        elif isinstance(functions, dict):
+        if type_definitions is None:
+            type_definitions = {}
+        if isinstance(functions, dict) and isinstance(type_definitions, dict):
+            # sniff the first key of each dict to pick a fast path; both paths
+            # still validate every key, since a mixed dict handed uncoerced to
+            # the C++ ctor would reinterpret its keys unchecked
+            func_key = next(iter(functions), None)
+            type_key = next(iter(type_definitions), None)
+            if (func_key is None or isinstance(func_key, _GlobalVar)) \
+                    and (type_key is None or isinstance(type_key, _GlobalTypeVar)) \
+                    and all(isinstance(k, _GlobalVar) for k in functions) \
+                    and all(isinstance(k, _GlobalTypeVar) for k in type_definitions):
+                # already coerced upstream, nothing to rebuild
+                self.__init_handle_by_constructor__(_ffi_api.IRModule,
+                                                    _to_ir(functions),
+                                                    _to_ir(type_definitions))
+                return
+            if (func_key is None or _is_string(func_key)) \
+                    and (type_key is None or _is_string(type_key)) \
+                    and all(_is_string(k) for k in functions) \
+                    and all(_is_string(k) for k in type_definitions):
+                # the common python-authored case: all keys are names, so the
+                # GlobalVar/GlobalTypeVar coercion runs in one C++ pass instead
+                # of one wrapper construction per key
+                self.__init_handle_by_constructor__(_ffi_api.IRModule_FromStringKeyedDicts,
+                                                    _to_ir(functions),
+                                                    _to_ir(type_definitions))
+                return
+        if isinstance(functions, dict):
             mapped_funcs = {}
             for k, v in functions.items():
-                if isinstance(k, string_types):
-                    k = _expr.GlobalVar(k)
-                if not isinstance(k, _expr.GlobalVar):
+                if _is_string(k):
+                    k = _GlobalVar(k)
+                elif type(k) is not _GlobalVar and not isinstance(k, _GlobalVar):
                     raise TypeError("Expect functions to be Dict[GlobalVar, Function]")
                 mapped_funcs[k] = v
             functions = mapped_funcs
-        if type_definitions is None:
-            type_definitions = {}
-        elif isinstance(type_definitions, dict):
+        if isinstance(type_definitions, dict):
             mapped_type_defs = {}
             for k, v in type_definitions.items():
-                if isinstance(k, string_types):
-                    k = _ty.GlobalTypeVar(k)
-                if not isinstance(k, _ty.GlobalTypeVar):
+                if _is_string(k):
+                    k = _GlobalTypeVar(k)
+                elif type(k) is not _GlobalTypeVar and not isinstance(k, _GlobalTypeVar):
                     raise TypeError("Expect type_definitions to be Dict[GlobalTypeVar, Type]")
                 mapped_type_defs[k] = v
             type_definitions = mapped_type_defs
@@ -83,22 +147,29 @@ class IRModule(Node):
         val: Union[Function, Type]
             The value.
         """
-        return self._add(var, _to_ir(val), True)
+        return self._add(var, _to_ir_fast(val), True)
+
+    def _invalidate_name_caches(self):
+        # instances handed back from C++ never run __init__, so assign
+        # instead of clearing in place
+        self._gv_cache = {}
+        self._gtv_cache = {}
 
     def _add(self, var, val, update=True):
-        if isinstance(val, _expr.HLOExpr):
-            if isinstance(var, string_types):
+        self._invalidate_name_caches()
+        if type(val) is _GlobalVar or isinstance(val, _HLOExpr):
+            if _is_string(var):
                 var = var.encode("utf-8")
-                if _ffi_api.Module_ContainGlobalVar(self, var):
-                    var = _ffi_api.Module_GetGlobalVar(self, var)
+                if _Module_ContainGlobalVar(self, var):
+                    var = _Module_GetGlobalVar(self, var)
                 else:
-                    var = _expr.GlobalVar(var)
-            _ffi_api.Module_Add(self, var, val, update)
+                    var = _GlobalVar(var)
+            _Module_Add(self, var, val, update)
         else:
-            assert isinstance(val, _ty.Type)
-            if isinstance(var, string_types):
-                var = _ty.GlobalTypeVar(var)
-            _ffi_api.Module_AddDef(self, var, val, update)
+            assert isinstance(val, _Type)
+            if _is_string(var):
+                var = _GlobalTypeVar(var)
+            _Module_AddDef(self, var, val, update)
 
     def __getitem__(self, var):
         """Lookup a global definition by name or by variable.
@@ -113,11 +184,11 @@ class IRModule(Node):
         val: Union[Function, Type]
             The definition referenced by :code:`var` (either a function or type).
         """
-        if isinstance(var, string_types):
-            return _ffi_api.Module_Lookup_str(self, _to_ir(var))
-        if isinstance(var, _expr.GlobalVar):
-            return _ffi_api.Module_Lookup(self, var)
-        return _ffi_api.Module_LookupDef(self, var)
+        if _is_string(var):
+            return _Module_Lookup_str(self, _to_ir_str(var))
+        if isinstance(var, _GlobalVar):
+            return _Module_Lookup(self, var)
+        return _Module_LookupDef(self, var)
 
     def update(self, other):
         """Insert functions in another Module to current one.
@@ -130,8 +201,51 @@ class IRModule(Node):
         if isinstance(other, dict):
             other = IRModule(other)
 
+        self._invalidate_name_caches()
         return _ffi_api.Module_Update(self, other)
 
+    def update_many(self, mapping, update=True):
+        """Add many name -> definition entries to the module in bulk.
+
+        Unlike repeated __setitem__ calls, the whole mapping crosses the
+        FFI boundary in at most two calls (one for functions, one for
+        type definitions).
+
+        Parameters
+        ----------
+        mapping: Dict[str, Union[Function, Type]]
+            Map of global name to function or type definition.
+
+        update: bool
+            Whether existing entries may be overwritten.
+        """
+        self._invalidate_name_caches()
+        func_names = []
+        funcs = []
+        type_names = []
+        type_defs = []
+        for name, val in mapping.items():
+            if not _is_string(name):
+                # only the name crosses the FFI boundary (as Array<StringRef>),
+                # so pre-made vars must be unwrapped here and anything else
+                # rejected before it gets reinterpreted unchecked
+                if isinstance(name, (_GlobalVar, _GlobalTypeVar)):
+                    name = name.name_hint
+                else:
+                    raise TypeError(
+                        "Expect mapping keys to be str, GlobalVar or GlobalTypeVar")
+            if isinstance(val, _expr.HLOExpr):
+                func_names.append(name)
+                funcs.append(val)
+            else:
+                assert isinstance(val, _ty.Type)
+                type_names.append(name)
+                type_defs.append(val)
+        if func_names:
+            _ffi_api.Module_AddMany(self, _to_ir(func_names), _to_ir(funcs), update)
+        if type_names:
+            _ffi_api.Module_AddDefMany(self, _to_ir(type_names), _to_ir(type_defs), update)
+
     def update_func(self, var, func):
         """Update the function corresponding to a global variable in the
         module.
@@ -144,9 +258,11 @@ class IRModule(Node):
         func: tvm.relay.Function
             The function to be inserted.
         """
-        return _ffi_api.Module_UpdateFunction(self, _to_ir(var), func)
+        self._invalidate_name_caches()
+        return _ffi_api.Module_UpdateFunction(self, _to_ir_fast(var), func)
 
     def add_export_func(self, export_func):
+        self._invalidate_name_caches()
         return _ffi_api.Module_AddExportFunction(self, export_func)
 
     def set_main(self, main):
@@ -169,7 +285,13 @@ class IRModule(Node):
         ------
         tvm.error.TVMError if we cannot find corresponding global var.
         """
-        return _ffi_api.Module_GetGlobalVar(self, _to_ir(name))
+        cache = self.__dict__.setdefault("_gv_cache", {})
+        gv = cache.get(name)
+        if gv is None:
+            gv = _Module_GetGlobalVar(
+                self, _to_ir_str(name) if _is_string(name) else _to_ir_fast(name))
+            cache[name] = gv
+        return gv
 
     def get_global_vars(self):
         """Collect all global vars defined in this module.
@@ -208,7 +330,13 @@ class IRModule(Node):
         ------
         tvm.error.TVMError if we cannot find corresponding global type var.
         """
-        return _ffi_api.Module_GetGlobalTypeVar(self, _to_ir(name))
+        cache = self.__dict__.setdefault("_gtv_cache", {})
+        gtv = cache.get(name)
+        if gtv is None:
+            gtv = _ffi_api.Module_GetGlobalTypeVar(
+                self, _to_ir_str(name) if _is_string(name) else _to_ir_fast(name))
+            cache[name] = gtv
+        return gtv
 
     def get_type(self, name):
         ty_var = self.get_global_type_var(name)
@@ -19,14 +19,21 @@
 from .._ffi.base import load_lib_by_name
 
 _TEXT_OPS_LIB_LOADER_STATE = False
+_TEXT_OPS_LIB_SHA1 = None
 
 
 def load_text_ops_lib():
-    global _TEXT_OPS_LIB_LOADER_STATE
+    global _TEXT_OPS_LIB_LOADER_STATE, _TEXT_OPS_LIB_SHA1
     if _TEXT_OPS_LIB_LOADER_STATE:
         return
     _LIB, _LIB_NAME, _LIB_SHA1 = load_lib_by_name("libmatx_text_ops")
+    _TEXT_OPS_LIB_SHA1 = _LIB_SHA1
     _TEXT_OPS_LIB_LOADER_STATE = True
 
 
+def text_ops_lib_sha1():
+    """Return the sha1 of the loaded text ops library, or None if not loaded."""
+    return _TEXT_OPS_LIB_SHA1
+
+
 load_text_ops_lib()
@@ -17,14 +17,19 @@
 # specific language governing permissions and limitations
 # under the License.
 import sys
-from typing import List, Tuple, AnyStr, Any
+from typing import Dict, List, Tuple, AnyStr, Any
 
 from ..native import make_native_object
-from ._dso_loader import load_text_ops_lib
+from ._dso_loader import load_text_ops_lib, text_ops_lib_sha1
 
 load_text_ops_lib()
 matx = sys.modules['matx']
 
+# resolved once at import time and baked into the ctor default below, so
+# scripted constructions never call back into python helper code; keys the
+# on-disk vocab artifact to the library build that wrote it
+_VOCAB_CACHE_SIGNATURE = text_ops_lib_sha1() or ""
+
 
 class WordPieceTokenizerImpl(object):
 
@@ -35,6 +40,9 @@ class WordPieceTokenizerImpl(object):
                  subwords_prefix: str = "##",
                  skip_empty: bool = True,
                  max_bytes_per_token: int = 100,
+                 use_perfect_hash: bool = True,
+                 cache_size: int = 0,
+                 vocab_cache_signature: str = "",
                  ) -> None:
         self.native_tokenizer: Any = make_native_object(
             "text_tokenizer_WordPieceTokenizer",
@@ -44,6 +52,9 @@ class WordPieceTokenizerImpl(object):
             subwords_prefix,
             skip_empty,
             max_bytes_per_token,
+            use_perfect_hash,
+            cache_size,
+            vocab_cache_signature,
         )
 
     def tokenize(self, sentence: List[AnyStr]) -> List[AnyStr]:
@@ -52,6 +63,18 @@ class WordPieceTokenizerImpl(object):
     def tokenize_with_meta(self, sentence: List[AnyStr]) -> Tuple[List[AnyStr], List[int]]:
         return self.native_tokenizer.tokenize_with_meta(sentence)
 
+    def batch_tokenize(self, sentences: List[List[AnyStr]]) -> List[List[AnyStr]]:
+        return self.native_tokenizer.batch_tokenize(sentences)
+
+    def tokenize_ids(self, sentence: List[AnyStr]) -> Any:
+        return self.native_tokenizer.tokenize_ids(sentence)
+
+    def tokenize_ids_with_meta(self, sentence: List[AnyStr]) -> Any:
+        return self.native_tokenizer.tokenize_ids_with_meta(sentence)
+
+    def stats(self) -> Dict[str, int]:
+        return self.native_tokenizer.stats()
+
 
 class WordPieceTokenizer:
 
@@ -62,12 +85,57 @@ class WordPieceTokenizer:
                  subwords_prefix: str = "##",
                  skip_empty: bool = True,
                  max_bytes_per_token: int = 100,
+                 use_perfect_hash: bool = True,
+                 cache_size: int = 0,
+                 vocab_cache_signature: str = _VOCAB_CACHE_SIGNATURE,
                  ) -> None:
         self.tokenizer_impl: WordPieceTokenizerImpl = matx.script(WordPieceTokenizerImpl)(
-            vocab_path, lookup_id, unk_token, subwords_prefix, skip_empty, max_bytes_per_token)
+            vocab_path, lookup_id, unk_token, subwords_prefix, skip_empty,
+            max_bytes_per_token, use_perfect_hash, cache_size, vocab_cache_signature)
 
     def tokenize(self, sentence: List[AnyStr]) -> List[AnyStr]:
+        """Tokenize a list of words into subword tokens (or ids).
+
+        The GIL is released while the native tokenizer runs, so calls may
+        be fanned out across python threads (e.g. a ThreadPoolExecutor)
+        and will scale with cores. The tokenizer itself is stateless per
+        call unless built with cache_size > 0, in which case concurrent
+        callers of the same instance should hold their own instances.
+        """
         return self.tokenizer_impl.tokenize(sentence)
 
     def tokenizer_with_meta(self, sentence: List[AnyStr]) -> Tuple[List[AnyStr], List[int]]:
         return self.tokenizer_impl.tokenize_with_meta(sentence)
+
+    def batch_tokenize(self, sentences: List[List[AnyStr]]) -> List[List[AnyStr]]:
+        """Tokenize a batch of sentences in one native call.
+
+        Compared with calling tokenize in a python loop, the whole batch
+        crosses the python/native boundary only once.
+        """
+        return self.tokenizer_impl.batch_tokenize(sentences)
+
+    def tokenize_ids(self, sentence: List[AnyStr]) -> Any:
+        """Tokenize and return token ids as a contiguous NDArray.
+
+        Requires lookup_id=True. The ids are written into one flat buffer
+        on the native side, so no per-id python int is allocated. The
+        dtype is uint16 when the vocab fits in 16 bits (e.g. BERT's
+        30522 entries), halving the output bandwidth, and int32 otherwise.
+        """
+        return self.tokenizer_impl.tokenize_ids(sentence)
+
+    def tokenize_ids_with_meta(self, sentence: List[AnyStr]) -> Any:
+        """Same as tokenize_ids, but also returns per-word token counts.
+
+        Returns a tuple of two NDArrays: (token_ids, token_lens). The ids
+        follow the tokenize_ids dtype rule; the lens are always int32.
+        """
+        return self.tokenizer_impl.tokenize_ids_with_meta(sentence)
+
+    def stats(self) -> Dict[str, int]:
+        """Return result-cache telemetry: cache_size, cache_hits, cache_misses.
+
+        All counters are 0 unless the tokenizer was built with cache_size > 0.
+        """
+        return self.tokenizer_impl.stats()
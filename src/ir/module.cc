@@ -321,6 +321,23 @@ MATXSCRIPT_REGISTER_GLOBAL("ir.IRModule")
       return IRModule(std::move(funcs), std::move(types), std::unordered_set<StringRef>());
     });
 
+MATXSCRIPT_REGISTER_GLOBAL("ir.IRModule_FromStringKeyedDicts")
+    .set_body_typed([](Map<StringRef, BaseFunc> funcs, Map<StringRef, ClassType> types) {
+      // fast path for python-authored modules: materialize the GlobalVar and
+      // GlobalTypeVar keys in one pass here instead of one wrapper object per
+      // key on the python side
+      Map<GlobalVar, BaseFunc> mapped_funcs;
+      for (const auto& kv : funcs) {
+        mapped_funcs.Set(GlobalVar(kv.first), kv.second);
+      }
+      Map<GlobalTypeVar, ClassType> mapped_types;
+      for (const auto& kv : types) {
+        mapped_types.Set(GlobalTypeVar(kv.first, TypeKind::kAdtHandle), kv.second);
+      }
+      return IRModule(
+          std::move(mapped_funcs), std::move(mapped_types), std::unordered_set<StringRef>());
+    });
+
 MATXSCRIPT_REGISTER_GLOBAL("ir.Module_Add").set_body([](PyArgs args) -> RTValue {
   IRModule mod = args[0].As<IRModule>();
   GlobalVar var = args[1].As<GlobalVar>();
@@ -345,6 +362,27 @@ MATXSCRIPT_REGISTER_GLOBAL("ir.Module_Add").set_body([](PyArgs args) -> RTValue
   return mod;
 });
 
+MATXSCRIPT_REGISTER_GLOBAL("ir.Module_AddMany")
+    .set_body_typed([](IRModule mod, Array<StringRef> names, Array<BaseFunc> funcs, bool update) {
+      MXCHECK_EQ(names.size(), funcs.size())
+          << "Module_AddMany: names and funcs size mismatch";
+      for (size_t i = 0; i < names.size(); ++i) {
+        GlobalVar var =
+            mod->ContainGlobalVar(names[i]) ? mod->GetGlobalVar(names[i]) : GlobalVar(names[i]);
+        mod->Add(var, funcs[i], update);
+      }
+      return mod;
+    });
+
+MATXSCRIPT_REGISTER_GLOBAL("ir.Module_AddDefMany")
+    .set_body_typed([](IRModule mod, Array<StringRef> names, Array<ClassType> types, bool update) {
+      MXCHECK_EQ(names.size(), types.size())
+          << "Module_AddDefMany: names and types size mismatch";
+      for (size_t i = 0; i < names.size(); ++i) {
+        mod->AddTypeDef(GlobalTypeVar(names[i], TypeKind::kAdtHandle), types[i], update);
+      }
+    });
+
 MATXSCRIPT_REGISTER_GLOBAL("ir.Module_AddDef")
     .set_body_typed([](IRModule mod, const GlobalTypeVar& var, const ClassType& type, bool update) {
       return mod->AddTypeDef(var, type, update);
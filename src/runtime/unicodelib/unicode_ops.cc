@@ -19,12 +19,40 @@
  * specific language governing permissions and limitations
  * under the License.
  */
+#include <cctype>
+
 #include <matxscript/runtime/container/unicode.h>
 #include <matxscript/runtime/unicodelib/unicode_ops.h>
 
 namespace matxscript {
 namespace runtime {
 
+static std::array<uint8_t, 256> BuildLatin1CharClassTable() noexcept {
+  std::array<uint8_t, 256> table{};
+  for (Py_UCS4 c = 0; c < 256; ++c) {
+    uint8_t flags = 0;
+    if (_PyUnicode_IsWhitespace(c)) {
+      flags |= kUnicodeClassSpace;
+    }
+    if (_PyUnicode_IsAlpha(c)) {
+      flags |= kUnicodeClassAlpha;
+    }
+    if (_PyUnicode_IsDigit(c)) {
+      flags |= kUnicodeClassDigit;
+    }
+    if (c < 0x80 && std::ispunct(static_cast<int>(c))) {
+      flags |= kUnicodeClassPunct;
+    }
+    if (c < 0x20 || c == 0x7F) {
+      flags |= kUnicodeClassControl;
+    }
+    table[c] = flags;
+  }
+  return table;
+}
+
+alignas(64) const std::array<uint8_t, 256> kLatin1CharClassTable = BuildLatin1CharClassTable();
+
 static inline Py_UCS4 handle_capital_sigma(const Py_UCS4* data, intptr_t length, intptr_t i) {
   intptr_t j;
   int final_sigma;
@@ -0,0 +1,77 @@
+# Copyright 2022 ByteDance Ltd. and/or its affiliates.
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import unittest
+import matx
+
+
+class TestIRModule(unittest.TestCase):
+
+    @staticmethod
+    def make_prim_func(name):
+        """
+        Source:
+        def <name>(a:int, b:int):
+            return a + b
+        """
+        a = matx.ir.PrimVar("a", "int64")
+        b = matx.ir.PrimVar("b", "int64")
+        ib = matx.ir.ir_builder.create()
+        ib.emit(matx.ir.ReturnStmt(a + b))
+        prim_func = matx.ir.PrimFunc([a, b], [], ib.get(), matx.ir.PrimType("int64"))
+        return prim_func.with_attr("global_symbol", name)
+
+    def test_update_many_matches_setitem(self):
+        names = ["func_a", "func_b", "func_c"]
+        funcs = {name: self.make_prim_func(name) for name in names}
+
+        ir_m_set = matx.ir.IRModule()
+        for name in names:
+            ir_m_set[name] = funcs[name]
+
+        ir_m_bulk = matx.ir.IRModule()
+        ir_m_bulk.update_many(funcs)
+
+        for name in names:
+            gv_set = ir_m_set.get_global_var(name)
+            gv_bulk = ir_m_bulk.get_global_var(name)
+            self.assertEqual(gv_set.name_hint, gv_bulk.name_hint)
+            matx.ir.assert_structural_equal(ir_m_set[name], ir_m_bulk[name])
+
+    def test_init_from_name_keyed_dict(self):
+        names = ["func_a", "func_b"]
+        funcs = {name: self.make_prim_func(name) for name in names}
+
+        ir_m = matx.ir.IRModule(funcs)
+        for name in names:
+            self.assertEqual(ir_m.get_global_var(name).name_hint, name)
+            matx.ir.assert_structural_equal(ir_m[name], funcs[name])
+
+        # already-normalized GlobalVar keys construct the same module
+        gv_funcs = {matx.ir.GlobalVar(name): funcs[name] for name in names}
+        ir_m2 = matx.ir.IRModule(gv_funcs)
+        for name in names:
+            matx.ir.assert_structural_equal(ir_m2[name], ir_m[name])
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.basicConfig(level=logging.INFO)
+    unittest.main()
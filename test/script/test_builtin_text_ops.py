@@ -69,6 +69,76 @@ class TestBuiltinTextOps(unittest.TestCase):
         print(tx_ret3)
         self.assertEqual(tx_ret3, expect)
 
+    def test_wordpiece_tokenizer_batch(self):
+        vocab_path = self.data_path + os.sep + "vocab.txt"
+        tokenizer = matx.text.WordPieceTokenizer(
+            vocab_path=vocab_path,
+            lookup_id=False,
+            subwords_prefix="",
+        )
+
+        examples = [["hello", "world"], ["helloworld", "kkk"]]
+        expect = [["hello", "world"], ["hello", "world", "[UNK]"]]
+        tx_ret = tokenizer.batch_tokenize(examples)
+        print(tx_ret)
+        self.assertEqual(tx_ret, expect)
+
+    def test_wordpiece_tokenizer_ids(self):
+        vocab_path = self.data_path + os.sep + "vocab.txt"
+        tokenizer = matx.text.WordPieceTokenizer(
+            vocab_path=vocab_path,
+            subwords_prefix="",
+        )
+
+        example = ["hello", "world", "helloworld", "kkk"]
+        # vocab ids: [CLS]=0 [SEP]=1 [UNK]=2 hello=3 world=4
+        expect = [3, 4, 3, 4, 2]
+        tx_ret = tokenizer.tokenize_ids(example)
+        print(tx_ret)
+        # the vocab fits in 16 bits, so ids come back as uint16
+        self.assertEqual(tx_ret.dtype(), "uint16")
+        self.assertEqual(list(tx_ret.asnumpy()), expect)
+
+        tx_ids, tx_lens = tokenizer.tokenize_ids_with_meta(example)
+        self.assertEqual(list(tx_ids.asnumpy()), expect)
+        self.assertEqual(tx_lens.dtype(), "int32")
+        self.assertEqual(list(tx_lens.asnumpy()), [1, 1, 2, 1])
+
+    def test_wordpiece_tokenizer_cache(self):
+        vocab_path = self.data_path + os.sep + "vocab.txt"
+        tokenizer = matx.text.WordPieceTokenizer(
+            vocab_path=vocab_path,
+            lookup_id=False,
+            subwords_prefix="",
+            cache_size=16,
+        )
+
+        example = ["hello", "world", "helloworld", "kkk"]
+        expect = ["hello", "world", "hello", "world", "[UNK]"]
+        tx_ret1 = tokenizer.tokenize(example)
+        tx_ret2 = tokenizer.tokenize(example)
+        self.assertEqual(tx_ret1, expect)
+        self.assertEqual(tx_ret2, expect)
+        stats = tokenizer.stats()
+        print(stats)
+        self.assertEqual(stats["cache_misses"], 1)
+        self.assertEqual(stats["cache_hits"], 1)
+
+    def test_wordpiece_tokenizer_trie_fallback(self):
+        vocab_path = self.data_path + os.sep + "vocab.txt"
+        tokenizer = matx.text.WordPieceTokenizer(
+            vocab_path=vocab_path,
+            lookup_id=False,
+            subwords_prefix="",
+            use_perfect_hash=False,
+        )
+
+        example = ["hello", "world", "helloworld", "kkk"]
+        expect = ["hello", "world", "hello", "world", "[UNK]"]
+        tx_ret = tokenizer.tokenize(example)
+        print(tx_ret)
+        self.assertEqual(tx_ret, expect)
+
     def test_jieba(self):
         test_content = "这是一个伸手不见五指的黑夜。我叫孙悟空，我爱北京，我爱Python和C++。"
         jieba = matx.text.Jieba()
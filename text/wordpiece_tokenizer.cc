@@ -17,10 +17,18 @@
  * specific language governing permissions and limitations
  * under the License.
  */
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <cstdio>
 #include <map>
+#include <vector>
 
 #include <matxscript/runtime/algorithm/cedar.h>
 #include <matxscript/runtime/algorithm/prefix_mapping.h>
+#include <matxscript/runtime/bytes_hash.h>
 #include <matxscript/runtime/container.h>
 #include <matxscript/runtime/file_reader.h>
 #include <matxscript/runtime/file_util.h>
@@ -31,11 +39,349 @@
 
 #include "common_funcs.h"
 
+#if defined(__AVX2__)
+#include <immintrin.h>
+#elif defined(__aarch64__) && defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
 namespace matxscript {
 namespace runtime {
 namespace extension {
 namespace tokenizer {
 
+namespace {
+// Equality compare specialized for vocab verification after a fingerprint
+// hit: walks 32 (AVX2) or 16 (NEON) bytes per step on unaligned pointers and
+// leaves the tail to memcmp. Falls back to plain memcmp elsewhere.
+inline bool BytesEqual(const char* a, const char* b, size_t len) noexcept {
+#if defined(__AVX2__)
+  while (len >= 32) {
+    __m256i va = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(a));
+    __m256i vb = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(b));
+    if (_mm256_movemask_epi8(_mm256_cmpeq_epi8(va, vb)) != -1) {
+      return false;
+    }
+    a += 32;
+    b += 32;
+    len -= 32;
+  }
+#elif defined(__aarch64__) && defined(__ARM_NEON)
+  while (len >= 16) {
+    uint8x16_t va = vld1q_u8(reinterpret_cast<const uint8_t*>(a));
+    uint8x16_t vb = vld1q_u8(reinterpret_cast<const uint8_t*>(b));
+    if (vmaxvq_u8(veorq_u8(va, vb)) != 0) {
+      return false;
+    }
+    a += 16;
+    b += 16;
+    len -= 16;
+  }
+#endif
+  return std::memcmp(a, b, len) == 0;
+}
+
+// FNV-1a over the raw vocab file bytes; identifies the vocab content a
+// saved artifact was built from
+inline uint64_t HashFileContent(const String& path) {
+  uint64_t state = 14695981039346656037ULL;
+  std::FILE* fp = std::fopen(path.c_str(), "rb");
+  if (fp == nullptr) {
+    return state;
+  }
+  char buffer[65536];
+  size_t nread;
+  while ((nread = std::fread(buffer, 1, sizeof(buffer), fp)) > 0) {
+    for (size_t i = 0; i < nread; ++i) {
+      state = (state ^ static_cast<unsigned char>(buffer[i])) * 1099511628211ULL;
+    }
+  }
+  std::fclose(fp);
+  return state;
+}
+}  // namespace
+
+// Exact-match vocab table built once from the fixed vocab at load time.
+// Entries are partitioned into one shard per key length, each shard a flat
+// open-addressed array sized to the next power of two, so a probe uses
+// masking instead of '%' and only touches the (L1-sized) shard of the probed
+// length. Each slot keeps the 64-bit fingerprint of its key next to the id,
+// and the key bytes of all entries are packed into one arena; a probe
+// compares the fingerprint first and only touches the arena on a fingerprint
+// hit. Within a shard a fingerprint hit implies a length match, so the hit
+// path carries no length comparison.
+class VocabHashTable {
+ public:
+  explicit VocabHashTable(const std::map<String, int>& dic);
+  ~VocabHashTable();
+
+  // Finds the longest entry in dic, which is a prefix of `w`.
+  // Returns the byte length of the matched entry, or 0 if none matches.
+  // Mirrors the contract of PrefixMapping::PrefixSearch.
+  int PrefixSearch(const char* w, size_t w_len, int* val) const;
+
+  // Writes the shard table, slot array and key arena to `path` so a later
+  // process can mmap them back instead of re-parsing the vocab file.
+  // `source_sig` identifies the vocab content the table was built from.
+  // Best effort: returns false without side effects on any I/O error.
+  bool Save(const String& path, uint64_t source_sig) const;
+
+  // Maps a table previously written by Save. Returns nullptr if the file is
+  // missing, was written from different vocab content, or fails validation;
+  // the caller then falls back to building from the vocab file.
+  static std::shared_ptr<VocabHashTable> Load(const String& path, uint64_t source_sig);
+
+  // Invokes fn(key_ptr, key_len, id) for every vocab entry.
+  template <class Fn>
+  void ForEachEntry(Fn fn) const {
+    for (const LenShard& shard : shards_) {
+      for (uint64_t i = 0; i < shard.size; ++i) {
+        const Entry& entry = slots_[shard.offset + i];
+        if (entry.len != 0) {
+          fn(arena_ + entry.offset, static_cast<size_t>(entry.len), entry.id);
+        }
+      }
+    }
+  }
+
+  int64_t MaxId() const {
+    int64_t max_id = -1;
+    ForEachEntry([&max_id](const char*, size_t, int32_t id) {
+      max_id = std::max<int64_t>(max_id, id);
+    });
+    return max_id;
+  }
+
+ private:
+  VocabHashTable() = default;
+
+  struct Entry {
+    uint64_t fp = 0;
+    int32_t id = 0;
+    uint32_t offset = 0;
+    uint32_t len = 0;  // 0 marks an empty slot; otherwise the shard length
+  };
+
+  struct LenShard {
+    uint64_t mask = 0;
+    uint64_t offset = 0;  // first slot of this shard in the flat slot array
+    uint64_t size = 0;    // 0 marks a length with no vocab entries
+  };
+
+  struct ArtifactHeader {
+    uint64_t magic = 0;
+    uint64_t version = 0;
+    uint64_t source_sig = 0;
+    uint64_t num_shards = 0;
+    uint64_t num_slots = 0;
+    uint64_t arena_size = 0;
+  };
+
+  static constexpr uint64_t kArtifactMagic = 0x314241435658544DULL;  // "MTXVCAB1"
+  static constexpr uint64_t kArtifactVersion = 1;
+
+  // FNV-1a, chosen because it is byte-incremental: the fingerprint of a
+  // prefix extended by one byte is one HashStep away from the previous one.
+  static constexpr uint64_t kHashSeed = 14695981039346656037ULL;
+
+  static uint64_t HashStep(uint64_t state, unsigned char c) noexcept {
+    return (state ^ c) * 1099511628211ULL;
+  }
+
+  static uint64_t HashKey(const char* w, size_t w_len) noexcept {
+    uint64_t state = kHashSeed;
+    for (size_t i = 0; i < w_len; ++i) {
+      state = HashStep(state, static_cast<unsigned char>(w[i]));
+    }
+    return state;
+  }
+
+  bool Lookup(const char* w, size_t w_len, uint64_t fp, int* val) const;
+
+ private:
+  std::vector<LenShard> shards_;  // indexed by key byte length
+  // slots_/arena_ point either at the owned storage below or into a
+  // read-only mmap of a saved artifact
+  const Entry* slots_ = nullptr;
+  const char* arena_ = nullptr;
+  uint64_t num_slots_ = 0;
+  uint64_t arena_size_ = 0;
+  std::vector<Entry> owned_slots_;
+  String owned_arena_;
+  void* mmap_base_ = nullptr;
+  size_t mmap_size_ = 0;
+  size_t max_key_len_ = 0;
+};
+
+VocabHashTable::VocabHashTable(const std::map<String, int>& dic) {
+  size_t arena_size = 0;
+  std::vector<size_t> count_by_len;
+  for (auto& kv : dic) {
+    MXCHECK(!kv.first.empty()) << "[VocabHashTable] empty vocab entry";
+    arena_size += kv.first.size();
+    max_key_len_ = std::max<size_t>(max_key_len_, kv.first.size());
+    if (count_by_len.size() <= kv.first.size()) {
+      count_by_len.resize(kv.first.size() + 1, 0);
+    }
+    ++count_by_len[kv.first.size()];
+  }
+  owned_arena_.reserve(arena_size);
+
+  shards_.resize(max_key_len_ + 1);
+  uint64_t total_slots = 0;
+  for (size_t key_len = 0; key_len <= max_key_len_; ++key_len) {
+    if (key_len >= count_by_len.size() || count_by_len[key_len] == 0) {
+      continue;
+    }
+    size_t capacity = 8;
+    while (capacity < count_by_len[key_len] * 2) {
+      capacity <<= 1;
+    }
+    shards_[key_len].mask = capacity - 1;
+    shards_[key_len].offset = total_slots;
+    shards_[key_len].size = capacity;
+    total_slots += capacity;
+  }
+  owned_slots_.resize(total_slots);
+
+  for (auto& kv : dic) {
+    Entry entry;
+    entry.fp = HashKey(kv.first.data(), kv.first.size());
+    entry.id = kv.second;
+    entry.offset = owned_arena_.size();
+    entry.len = kv.first.size();
+    owned_arena_.append(kv.first);
+
+    const LenShard& shard = shards_[kv.first.size()];
+    uint64_t idx = entry.fp & shard.mask;
+    while (owned_slots_[shard.offset + idx].len != 0) {
+      idx = (idx + 1) & shard.mask;
+    }
+    owned_slots_[shard.offset + idx] = entry;
+  }
+  slots_ = owned_slots_.data();
+  arena_ = owned_arena_.data();
+  num_slots_ = total_slots;
+  arena_size_ = owned_arena_.size();
+}
+
+VocabHashTable::~VocabHashTable() {
+  if (mmap_base_ != nullptr) {
+    munmap(mmap_base_, mmap_size_);
+  }
+}
+
+bool VocabHashTable::Save(const String& path, uint64_t source_sig) const {
+  String tmp_path = path + ".tmp";
+  std::FILE* fp = std::fopen(tmp_path.c_str(), "wb");
+  if (fp == nullptr) {
+    return false;
+  }
+  ArtifactHeader header;
+  header.magic = kArtifactMagic;
+  header.version = kArtifactVersion;
+  header.source_sig = source_sig;
+  header.num_shards = shards_.size();
+  header.num_slots = num_slots_;
+  header.arena_size = arena_size_;
+  bool ok = std::fwrite(&header, sizeof(header), 1, fp) == 1;
+  ok = ok && std::fwrite(shards_.data(), sizeof(LenShard), shards_.size(), fp) == shards_.size();
+  ok = ok && std::fwrite(slots_, sizeof(Entry), num_slots_, fp) == num_slots_;
+  ok = ok && (arena_size_ == 0 || std::fwrite(arena_, 1, arena_size_, fp) == arena_size_);
+  ok = (std::fclose(fp) == 0) && ok;
+  // rename is atomic, so a concurrent construction never maps a half
+  // written artifact
+  if (!ok || std::rename(tmp_path.c_str(), path.c_str()) != 0) {
+    std::remove(tmp_path.c_str());
+    return false;
+  }
+  return true;
+}
+
+std::shared_ptr<VocabHashTable> VocabHashTable::Load(const String& path, uint64_t source_sig) {
+  int fd = ::open(path.c_str(), O_RDONLY);
+  if (fd < 0) {
+    return nullptr;
+  }
+  struct stat st;
+  if (::fstat(fd, &st) != 0 || static_cast<size_t>(st.st_size) < sizeof(ArtifactHeader)) {
+    ::close(fd);
+    return nullptr;
+  }
+  size_t file_size = st.st_size;
+  void* base = ::mmap(nullptr, file_size, PROT_READ, MAP_PRIVATE, fd, 0);
+  ::close(fd);
+  if (base == MAP_FAILED) {
+    return nullptr;
+  }
+  const auto* header = reinterpret_cast<const ArtifactHeader*>(base);
+  size_t expect_size = sizeof(ArtifactHeader) + header->num_shards * sizeof(LenShard) +
+                       header->num_slots * sizeof(Entry) + header->arena_size;
+  if (header->magic != kArtifactMagic || header->version != kArtifactVersion ||
+      header->source_sig != source_sig || expect_size != file_size) {
+    munmap(base, file_size);
+    return nullptr;
+  }
+  std::shared_ptr<VocabHashTable> table(new VocabHashTable());
+  table->mmap_base_ = base;
+  table->mmap_size_ = file_size;
+  const char* cursor = reinterpret_cast<const char*>(base) + sizeof(ArtifactHeader);
+  const auto* shards = reinterpret_cast<const LenShard*>(cursor);
+  table->shards_.assign(shards, shards + header->num_shards);
+  cursor += header->num_shards * sizeof(LenShard);
+  table->slots_ = reinterpret_cast<const Entry*>(cursor);
+  cursor += header->num_slots * sizeof(Entry);
+  table->arena_ = cursor;
+  table->num_slots_ = header->num_slots;
+  table->arena_size_ = header->arena_size;
+  table->max_key_len_ = header->num_shards == 0 ? 0 : header->num_shards - 1;
+  return table;
+}
+
+bool VocabHashTable::Lookup(const char* w, size_t w_len, uint64_t fp, int* val) const {
+  const LenShard& shard = shards_[w_len];
+  if (shard.size == 0) {
+    return false;
+  }
+  const Entry* entries = slots_ + shard.offset;
+  uint64_t idx = fp & shard.mask;
+  while (true) {
+    const Entry& entry = entries[idx];
+    if (entry.len == 0) {
+      return false;
+    }
+    // all used entries in this shard share w_len, so a fingerprint hit
+    // goes straight to the byte verify
+    if (entry.fp == fp && BytesEqual(arena_ + entry.offset, w, w_len)) {
+      *val = entry.id;
+      return true;
+    }
+    idx = (idx + 1) & shard.mask;
+  }
+}
+
+int VocabHashTable::PrefixSearch(const char* w, size_t w_len, int* val) const {
+  size_t max_probe = std::min(w_len, max_key_len_);
+  if (max_probe == 0) {
+    return 0;
+  }
+  // One forward pass extends the running hash by one byte per step, so
+  // fingerprinting all candidate prefixes costs O(L) instead of O(L^2).
+  commons::details::SmallBuffer<1024> hash_buffer(max_probe * sizeof(uint64_t));
+  uint64_t* prefix_fps = reinterpret_cast<uint64_t*>(hash_buffer.Data());
+  uint64_t state = kHashSeed;
+  for (size_t i = 0; i < max_probe; ++i) {
+    state = HashStep(state, static_cast<unsigned char>(w[i]));
+    prefix_fps[i] = state;
+  }
+  for (size_t probe_len = max_probe; probe_len > 0; --probe_len) {
+    if (Lookup(w, probe_len, prefix_fps[probe_len - 1], val)) {
+      return probe_len;
+    }
+  }
+  return 0;
+}
+
 class WordPieceTokenizer {
  public:
   WordPieceTokenizer(String vocab_path,
@@ -43,7 +389,10 @@ class WordPieceTokenizer {
                      const Any& unk_token,
                      String subwords_prefix,
                      bool skip_empty,
-                     int max_bytes_per_token);
+                     int max_bytes_per_token,
+                     bool use_perfect_hash = true,
+                     int cache_size = 0,
+                     String lib_signature = String());
   virtual ~WordPieceTokenizer() = default;
 
  public:
@@ -55,20 +404,67 @@ class WordPieceTokenizer {
  public:
   RTValue tokenize(PyArgs args);
   RTValue tokenize_with_meta(PyArgs args);
+  RTValue batch_tokenize(PyArgs args);
+  RTValue tokenize_ids(PyArgs args);
+  RTValue tokenize_ids_with_meta(PyArgs args);
+  RTValue stats(PyArgs args);
 
  private:
-  template <class PostFunction>
+  template <bool SkipEmpty, class PostFunction>
   inline void TokenizeImplWithPrefix(const char* token_buf,
                                      int64_t token_len,
                                      const PostFunction& post_func,
                                      const List& output_tokens) const;
 
-  template <class PostFunction>
+  template <bool SkipEmpty, class PostFunction>
   inline void TokenizeImplNoPrefix(const char* token_buf,
                                    int64_t token_len,
                                    const PostFunction& post_func,
                                    const List& output_tokens) const;
 
+  // The three ctor flags are loop-invariant, so the per-word kernel is
+  // instantiated once per flag combination and the ctor binds the matching
+  // specialization; the per-word branches on skip_empty_ / lookup_id_ /
+  // subwords_prefix_ fold away inside each instantiation.
+  template <bool SkipEmpty, bool LookupId, bool HasPrefix>
+  void TokenizeBytes(const string_view& raw_token, const List& output_tokens) const;
+
+  template <bool SkipEmpty, bool LookupId, bool HasPrefix>
+  void TokenizeUnicode(const unicode_view& raw_token, const List& output_tokens) const;
+
+  using BytesTokenizeFn = void (WordPieceTokenizer::*)(const string_view&, const List&) const;
+  using UnicodeTokenizeFn = void (WordPieceTokenizer::*)(const unicode_view&, const List&) const;
+
+  template <bool SkipEmpty, bool LookupId, bool HasPrefix>
+  void BindTokenizeKernel() {
+    bytes_tokenize_fn_ = &WordPieceTokenizer::TokenizeBytes<SkipEmpty, LookupId, HasPrefix>;
+    unicode_tokenize_fn_ = &WordPieceTokenizer::TokenizeUnicode<SkipEmpty, LookupId, HasPrefix>;
+  }
+
+  void SelectTokenizeKernel();
+
+ private:
+  // Fixed-size result cache for tokenize, keyed by the 64-bit hash of the
+  // concatenated sentence. The full key bytes are kept next to the hash so a
+  // colliding sentence can never observe another sentence's tokens. One slot
+  // per hash bucket, replaced on miss; not synchronized, same as the rest of
+  // the tokenizer state.
+  struct CacheSlot {
+    uint64_t hash = 0;
+    String key;
+    List result;
+    bool valid = false;
+  };
+
+  static String MakeCacheKey(const List& sentence);
+
+  inline int LongestMatch(const char* w, size_t w_len, int* val) const {
+    if (vocab_table_) {
+      return vocab_table_->PrefixSearch(w, w_len, val);
+    }
+    return prefix_matcher_->PrefixSearch(w, w_len, val);
+  }
+
  private:
   String vocab_path_;
   bool skip_empty_;
@@ -78,6 +474,20 @@ class WordPieceTokenizer {
   int unk_id_;
   String subwords_prefix_;
   std::shared_ptr<PrefixMapping> prefix_matcher_;
+  std::shared_ptr<VocabHashTable> vocab_table_;
+  // id -> token caches, built only when lookup_id is False: the output path
+  // then hands out refcounted copies of load-time strings instead of
+  // allocating (and for unicode, re-decoding) one fresh object per token
+  std::vector<String> vocab_bytes_;
+  std::vector<Unicode> vocab_unicode_;
+  // every id fits in uint16, so tokenize_ids can emit the narrower dtype
+  bool ids_fit_uint16_ = false;
+  BytesTokenizeFn bytes_tokenize_fn_ = nullptr;
+  UnicodeTokenizeFn unicode_tokenize_fn_ = nullptr;
+  std::vector<CacheSlot> cache_;
+  uint64_t cache_mask_ = 0;
+  uint64_t cache_hits_ = 0;
+  uint64_t cache_misses_ = 0;
 };
 
 WordPieceTokenizer::WordPieceTokenizer(String vocab_path,
@@ -85,7 +495,10 @@ WordPieceTokenizer::WordPieceTokenizer(String vocab_path,
                                        const Any& unk_token,
                                        String subwords_prefix,
                                        bool skip_empty,
-                                       int max_bytes_per_token) {
+                                       int max_bytes_per_token,
+                                       bool use_perfect_hash,
+                                       int cache_size,
+                                       String lib_signature) {
   if (unk_token.is_nullptr()) {
     MXCHECK(!lookup_id) << "unk_token must not be None when lookup_id is True";
   }
@@ -97,29 +510,82 @@ WordPieceTokenizer::WordPieceTokenizer(String vocab_path,
   vocab_path_ = std::move(vocab_path);
   MXCHECK(FileUtil::Exists(vocab_path_)) << "vocab file \"" << vocab_path_ << "\" not exists!";
 
-  std::map<String, int> tokens;
-  FileReader reader(vocab_path_);
-  const char* line = nullptr;
-  size_t line_len = 0;
-  int64_t line_no = 0;
-  while (reader.ReadLine(&line, &line_len)) {
-    // Ignoring empty lines
-    if (line_len == 0) {
-      continue;
+  if (cache_size > 0) {
+    uint64_t cache_capacity = 16;
+    while (cache_capacity < static_cast<uint64_t>(cache_size)) {
+      cache_capacity <<= 1;
+    }
+    cache_mask_ = cache_capacity - 1;
+    cache_.resize(cache_capacity);
+  }
+
+  // the artifact is only valid for the library build that wrote it (the
+  // slot layout is not a stable format), so its name carries the library
+  // signature and its header the vocab content hash
+  String artifact_path;
+  uint64_t vocab_sig = 0;
+  if (use_perfect_hash && !lib_signature.empty()) {
+    size_t sig_len = std::min<size_t>(lib_signature.size(), 8);
+    artifact_path = vocab_path_ + ".mtxvocab." + String(lib_signature.data(), sig_len);
+    vocab_sig = HashFileContent(vocab_path_);
+    vocab_table_ = VocabHashTable::Load(artifact_path, vocab_sig);
+  }
+  if (vocab_table_) {
+    // mapped artifact: vocab ids and the id -> token caches come from the
+    // table itself, so the line-by-line parse is skipped entirely
+    int64_t vocab_count = vocab_table_->MaxId() + 1;
+    ids_fit_uint16_ = vocab_count <= 65536;
+    if (!lookup_id_) {
+      vocab_bytes_.resize(vocab_count);
+      vocab_unicode_.resize(vocab_count);
+      vocab_table_->ForEachEntry([this](const char* key, size_t key_len, int32_t id) {
+        vocab_bytes_[id] = String(key, key_len);
+        vocab_unicode_[id] = UTF8Decode(key, key_len);
+      });
+    }
+  } else {
+    std::map<String, int> tokens;
+    FileReader reader(vocab_path_);
+    const char* line = nullptr;
+    size_t line_len = 0;
+    int64_t line_no = 0;
+    while (reader.ReadLine(&line, &line_len)) {
+      // Ignoring empty lines
+      if (line_len == 0) {
+        continue;
+      }
+      tokens.emplace(String(line, line_len), line_no);
+      ++line_no;
+    }
+    ids_fit_uint16_ = line_no <= 65536;  // ids are 0 .. line_no - 1
+    if (use_perfect_hash) {
+      vocab_table_ = std::make_shared<VocabHashTable>(tokens);
+      if (!artifact_path.empty()) {
+        // best effort; a read-only vocab directory just skips persistence
+        vocab_table_->Save(artifact_path, vocab_sig);
+      }
+    } else {
+      prefix_matcher_ = std::make_shared<PrefixMapping>(tokens);
+    }
+    if (!lookup_id_) {
+      vocab_bytes_.resize(line_no);
+      vocab_unicode_.resize(line_no);
+      for (auto& kv : tokens) {
+        vocab_bytes_[kv.second] = kv.first;
+        vocab_unicode_[kv.second] = UTF8Decode(kv.first.data(), kv.first.size());
+      }
     }
-    tokens.emplace(String(line, line_len), line_no);
-    ++line_no;
   }
-  prefix_matcher_ = std::make_shared<PrefixMapping>(tokens);
+  SelectTokenizeKernel();
   if (unk_token.is_nullptr()) {
     unk_id_ = -1;
   } else {
-    auto match_len = prefix_matcher_->PrefixSearch(unk_token_.data(), unk_token_.size(), &unk_id_);
+    auto match_len = LongestMatch(unk_token_.data(), unk_token_.size(), &unk_id_);
     MXCHECK(match_len == unk_token_.size()) << "unk_token \'" << unk_token_ << "\' not found";
   }
 }
 
-template <class PostFunction>
+template <bool SkipEmpty, class PostFunction>
 inline void WordPieceTokenizer::TokenizeImplWithPrefix(const char* token_buf,
                                                        int64_t token_len,
                                                        const PostFunction& post_func,
@@ -131,7 +597,7 @@ inline void WordPieceTokenizer::TokenizeImplWithPrefix(const char* token_buf,
   auto sub_prefix_size = subwords_prefix_.size();
   std::memcpy(subword_buf, sub_prefix_ptr, sub_prefix_size);
 
-  if (skip_empty_ && token_len == 0) {
+  if (SkipEmpty && token_len == 0) {
     // strip empty word
     return;
   }
@@ -141,7 +607,7 @@ inline void WordPieceTokenizer::TokenizeImplWithPrefix(const char* token_buf,
   }
   auto token_ptr = token_buf;
   int value = -1;
-  int match_len = prefix_matcher_->PrefixSearch(token_ptr, token_len, &value);
+  int match_len = LongestMatch(token_ptr, token_len, &value);
   if (match_len == token_len) {
     // full match
     post_func(token_ptr, match_len, value, output_tokens);
@@ -160,7 +626,7 @@ inline void WordPieceTokenizer::TokenizeImplWithPrefix(const char* token_buf,
     subword_len += sub_prefix_size;
 
     while (subword_len > 0) {
-      match_len = prefix_matcher_->PrefixSearch(subword_ptr, subword_len, &value);
+      match_len = LongestMatch(subword_ptr, subword_len, &value);
       if (match_len == subword_len) {
         post_func(subword_ptr, match_len, value, output_tokens);
         break;
@@ -181,12 +647,12 @@ inline void WordPieceTokenizer::TokenizeImplWithPrefix(const char* token_buf,
   }
 }
 
-template <class PostFunction>
+template <bool SkipEmpty, class PostFunction>
 inline void WordPieceTokenizer::TokenizeImplNoPrefix(const char* token_buf,
                                                      int64_t token_len,
                                                      const PostFunction& post_func,
                                                      const List& output_tokens) const {
-  if (skip_empty_ && token_len == 0) {
+  if (SkipEmpty && token_len == 0) {
     // strip empty word
     return;
   }
@@ -196,7 +662,7 @@ inline void WordPieceTokenizer::TokenizeImplNoPrefix(const char* token_buf,
   }
   auto token_ptr = token_buf;
   int value = -1;
-  int match_len = prefix_matcher_->PrefixSearch(token_ptr, token_len, &value);
+  int match_len = LongestMatch(token_ptr, token_len, &value);
   if (match_len == token_len) {
     // full match
     post_func(token_ptr, match_len, value, output_tokens);
@@ -210,7 +676,7 @@ inline void WordPieceTokenizer::TokenizeImplNoPrefix(const char* token_buf,
     token_len -= match_len;
     token_ptr += match_len;
     while (token_len > 0) {
-      match_len = prefix_matcher_->PrefixSearch(token_ptr, token_len, &value);
+      match_len = LongestMatch(token_ptr, token_len, &value);
       if (match_len == token_len) {
         post_func(token_ptr, match_len, value, output_tokens);
         break;
@@ -230,51 +696,110 @@ inline void WordPieceTokenizer::TokenizeImplNoPrefix(const char* token_buf,
   }
 }
 
-void WordPieceTokenizer::tokenize(const string_view& raw_token, const List& output_tokens) const {
-  if (lookup_id_) {
+template <bool SkipEmpty, bool LookupId, bool HasPrefix>
+void WordPieceTokenizer::TokenizeBytes(const string_view& raw_token,
+                                       const List& output_tokens) const {
+  // LookupId and HasPrefix are compile-time constants here, so each
+  // instantiation keeps exactly one post_func and one impl call
+  if (LookupId) {
     auto post_func = [](const char* token_buf, int token_len, int value, const List& output) {
       output.push_back(value);
     };
-    if (subwords_prefix_.empty()) {
-      TokenizeImplNoPrefix(raw_token.data(), raw_token.size(), post_func, output_tokens);
+    if (HasPrefix) {
+      TokenizeImplWithPrefix<SkipEmpty>(
+          raw_token.data(), raw_token.size(), post_func, output_tokens);
     } else {
-      TokenizeImplWithPrefix(raw_token.data(), raw_token.size(), post_func, output_tokens);
+      TokenizeImplNoPrefix<SkipEmpty>(raw_token.data(), raw_token.size(), post_func, output_tokens);
     }
   } else {
-    auto post_func = [](const char* token_buf, int token_len, int value, const List& output) {
-      output.push_back(String(token_buf, token_len));
+    auto post_func = [this](const char* token_buf, int token_len, int value, const List& output) {
+      if (value >= 0) {
+        output.push_back(vocab_bytes_[value]);
+      } else {
+        output.push_back(String(token_buf, token_len));
+      }
     };
-    if (subwords_prefix_.empty()) {
-      TokenizeImplNoPrefix(raw_token.data(), raw_token.size(), post_func, output_tokens);
+    if (HasPrefix) {
+      TokenizeImplWithPrefix<SkipEmpty>(
+          raw_token.data(), raw_token.size(), post_func, output_tokens);
     } else {
-      TokenizeImplWithPrefix(raw_token.data(), raw_token.size(), post_func, output_tokens);
+      TokenizeImplNoPrefix<SkipEmpty>(raw_token.data(), raw_token.size(), post_func, output_tokens);
     }
   }
 }
 
-void WordPieceTokenizer::tokenize(const unicode_view& raw_token, const List& output_tokens) const {
+template <bool SkipEmpty, bool LookupId, bool HasPrefix>
+void WordPieceTokenizer::TokenizeUnicode(const unicode_view& raw_token,
+                                         const List& output_tokens) const {
   auto bytes_tokens = UTF8Encode(raw_token);
-  if (lookup_id_) {
+  if (LookupId) {
     auto post_func = [](const char* token_buf, int token_len, int value, const List& output) {
       output.push_back(value);
     };
-    if (subwords_prefix_.empty()) {
-      TokenizeImplNoPrefix(bytes_tokens.data(), bytes_tokens.size(), post_func, output_tokens);
+    if (HasPrefix) {
+      TokenizeImplWithPrefix<SkipEmpty>(
+          bytes_tokens.data(), bytes_tokens.size(), post_func, output_tokens);
     } else {
-      TokenizeImplWithPrefix(bytes_tokens.data(), bytes_tokens.size(), post_func, output_tokens);
+      TokenizeImplNoPrefix<SkipEmpty>(
+          bytes_tokens.data(), bytes_tokens.size(), post_func, output_tokens);
     }
   } else {
-    auto post_func = [](const char* token_buf, int token_len, int value, const List& output) {
-      output.push_back(UTF8Decode(token_buf, token_len));
+    auto post_func = [this](const char* token_buf, int token_len, int value, const List& output) {
+      if (value >= 0) {
+        output.push_back(vocab_unicode_[value]);
+      } else {
+        output.push_back(UTF8Decode(token_buf, token_len));
+      }
     };
-    if (subwords_prefix_.empty()) {
-      TokenizeImplNoPrefix(bytes_tokens.data(), bytes_tokens.size(), post_func, output_tokens);
+    if (HasPrefix) {
+      TokenizeImplWithPrefix<SkipEmpty>(
+          bytes_tokens.data(), bytes_tokens.size(), post_func, output_tokens);
     } else {
-      TokenizeImplWithPrefix(bytes_tokens.data(), bytes_tokens.size(), post_func, output_tokens);
+      TokenizeImplNoPrefix<SkipEmpty>(
+          bytes_tokens.data(), bytes_tokens.size(), post_func, output_tokens);
     }
   }
 }
 
+void WordPieceTokenizer::SelectTokenizeKernel() {
+  const bool has_prefix = !subwords_prefix_.empty();
+  const int key = (skip_empty_ ? 4 : 0) | (lookup_id_ ? 2 : 0) | (has_prefix ? 1 : 0);
+  switch (key) {
+    case 0b000: {
+      BindTokenizeKernel<false, false, false>();
+    } break;
+    case 0b001: {
+      BindTokenizeKernel<false, false, true>();
+    } break;
+    case 0b010: {
+      BindTokenizeKernel<false, true, false>();
+    } break;
+    case 0b011: {
+      BindTokenizeKernel<false, true, true>();
+    } break;
+    case 0b100: {
+      BindTokenizeKernel<true, false, false>();
+    } break;
+    case 0b101: {
+      BindTokenizeKernel<true, false, true>();
+    } break;
+    case 0b110: {
+      BindTokenizeKernel<true, true, false>();
+    } break;
+    default: {
+      BindTokenizeKernel<true, true, true>();
+    } break;
+  }
+}
+
+void WordPieceTokenizer::tokenize(const string_view& raw_token, const List& output_tokens) const {
+  (this->*bytes_tokenize_fn_)(raw_token, output_tokens);
+}
+
+void WordPieceTokenizer::tokenize(const unicode_view& raw_token, const List& output_tokens) const {
+  (this->*unicode_tokenize_fn_)(raw_token, output_tokens);
+}
+
 void WordPieceTokenizer::tokenize(const List& sentence, const List& output_tokens) const {
   output_tokens.reserve(output_tokens.size() + sentence.size() + 4);
   for (auto& item : sentence) {
@@ -315,9 +840,122 @@ void WordPieceTokenizer::tokenize(const List& sentence,
   }
 }
 
+String WordPieceTokenizer::MakeCacheKey(const List& sentence) {
+  String key;
+  // each item is framed as tag + byte length + bytes: the length prefix
+  // makes the key self-delimiting, so items containing the tag bytes can
+  // never alias another sentence's key, and the distinct tags keep bytes
+  // and unicode inputs apart, since their outputs differ as well
+  for (auto& item : sentence) {
+    switch (item.type_code()) {
+      case TypeIndex::kRuntimeString: {
+        auto view = item.AsNoCheck<string_view>();
+        uint64_t item_len = view.size();
+        key.append(1, '\x01');
+        key.append(reinterpret_cast<const char*>(&item_len), sizeof(item_len));
+        key.append(view);
+      } break;
+      case TypeIndex::kRuntimeUnicode: {
+        auto bytes = UTF8Encode(item.AsNoCheck<unicode_view>());
+        uint64_t item_len = bytes.size();
+        key.append(1, '\x02');
+        key.append(reinterpret_cast<const char*>(&item_len), sizeof(item_len));
+        key.append(bytes);
+      } break;
+      default: {
+        MXCHECK(false) << "[WordPieceTokenizer] unsupported data type: " << item.type_name();
+      }
+    }
+  }
+  return key;
+}
+
 RTValue WordPieceTokenizer::tokenize(PyArgs args) {
   MXCHECK_EQ(args.size(), 1) << "[WordPieceTokenizer::tokenize] Expect 1 arguments but get "
                              << args.size();
+  MXCHECK(args[0].type_code() == TypeIndex::kRuntimeList)
+      << "[WordPieceTokenizer] unsupported data type: " << args[0].type_name();
+  auto sentence = args[0].AsObjectViewNoCheck<List>().data();
+  if (!cache_.empty()) {
+    String key = MakeCacheKey(sentence);
+    uint64_t key_hash = BytesHash(key.data(), key.size());
+    CacheSlot& slot = cache_[key_hash & cache_mask_];
+    if (slot.valid && slot.hash == key_hash && slot.key == key) {
+      ++cache_hits_;
+      // hand out a shallow copy so callers mutating the result
+      // cannot poison the cached entry
+      return List(slot.result.begin(), slot.result.end());
+    }
+    ++cache_misses_;
+    List output_tokens;
+    this->tokenize(sentence, output_tokens);
+    slot.hash = key_hash;
+    slot.key = std::move(key);
+    slot.result = List(output_tokens.begin(), output_tokens.end());
+    slot.valid = true;
+    return output_tokens;
+  }
+  List output_tokens;
+  this->tokenize(sentence, output_tokens);
+  return output_tokens;
+}
+
+RTValue WordPieceTokenizer::stats(PyArgs args) {
+  MXCHECK_EQ(args.size(), 0) << "[WordPieceTokenizer::stats] Expect 0 arguments but get "
+                             << args.size();
+  Dict result;
+  result.set_item(Unicode(U"cache_size"), static_cast<int64_t>(cache_.size()));
+  result.set_item(Unicode(U"cache_hits"), static_cast<int64_t>(cache_hits_));
+  result.set_item(Unicode(U"cache_misses"), static_cast<int64_t>(cache_misses_));
+  return result;
+}
+
+RTValue WordPieceTokenizer::tokenize_with_meta(PyArgs args) {
+  MXCHECK_EQ(args.size(), 1)
+      << "[WordPieceTokenizer::tokenize_with_meta] Expect 1 arguments but get " << args.size();
+  List output_tokens;
+  List output_lens;
+  switch (args[0].type_code()) {
+    case TypeIndex::kRuntimeList: {
+      this->tokenize(args[0].AsObjectViewNoCheck<List>().data(), output_tokens, output_lens);
+    } break;
+    default: {
+      MXCHECK(false) << "[WordPieceTokenizer] unsupported data type: " << args[0].type_name();
+    } break;
+  }
+  return Tuple::dynamic(output_tokens, output_lens);
+}
+
+namespace {
+inline NDArray ListToIdArray(const List& ids, bool use_uint16) {
+  int64_t num_ids = ids.size();
+  if (use_uint16) {
+    std::vector<uint16_t> buffer;
+    buffer.reserve(num_ids);
+    for (const auto& item : ids) {
+      buffer.push_back(static_cast<uint16_t>(item.As<int64_t>()));
+    }
+    auto arr = NDArray::Empty(
+        std::vector<int64_t>{num_ids}, DLDataType{kDLUInt, 16, 1}, DLDevice{kDLCPU, 0});
+    arr.CopyFromBytes(buffer.data(), buffer.size() * sizeof(uint16_t));
+    return arr;
+  }
+  std::vector<int32_t> buffer;
+  buffer.reserve(num_ids);
+  for (const auto& item : ids) {
+    buffer.push_back(static_cast<int32_t>(item.As<int64_t>()));
+  }
+  auto arr = NDArray::Empty(
+      std::vector<int64_t>{num_ids}, DLDataType{kDLInt, 32, 1}, DLDevice{kDLCPU, 0});
+  arr.CopyFromBytes(buffer.data(), buffer.size() * sizeof(int32_t));
+  return arr;
+}
+}  // namespace
+
+RTValue WordPieceTokenizer::tokenize_ids(PyArgs args) {
+  MXCHECK_EQ(args.size(), 1) << "[WordPieceTokenizer::tokenize_ids] Expect 1 arguments but get "
+                             << args.size();
+  MXCHECK(lookup_id_) << "[WordPieceTokenizer::tokenize_ids] lookup_id must be True";
   List output_tokens;
   switch (args[0].type_code()) {
     case TypeIndex::kRuntimeList: {
@@ -327,12 +965,13 @@ RTValue WordPieceTokenizer::tokenize(PyArgs args) {
       MXCHECK(false) << "[WordPieceTokenizer] unsupported data type: " << args[0].type_name();
     } break;
   }
-  return output_tokens;
+  return ListToIdArray(output_tokens, ids_fit_uint16_);
 }
 
-RTValue WordPieceTokenizer::tokenize_with_meta(PyArgs args) {
+RTValue WordPieceTokenizer::tokenize_ids_with_meta(PyArgs args) {
   MXCHECK_EQ(args.size(), 1)
-      << "[WordPieceTokenizer::tokenize_with_meta] Expect 1 arguments but get " << args.size();
+      << "[WordPieceTokenizer::tokenize_ids_with_meta] Expect 1 arguments but get " << args.size();
+  MXCHECK(lookup_id_) << "[WordPieceTokenizer::tokenize_ids_with_meta] lookup_id must be True";
   List output_tokens;
   List output_lens;
   switch (args[0].type_code()) {
@@ -343,33 +982,87 @@ RTValue WordPieceTokenizer::tokenize_with_meta(PyArgs args) {
       MXCHECK(false) << "[WordPieceTokenizer] unsupported data type: " << args[0].type_name();
     } break;
   }
-  return Tuple::dynamic(output_tokens, output_lens);
+  // lens count tokens per word and are not bounded by the vocab size,
+  // so they stay int32
+  return Tuple::dynamic(ListToIdArray(output_tokens, ids_fit_uint16_),
+                        ListToIdArray(output_lens, false));
+}
+
+RTValue WordPieceTokenizer::batch_tokenize(PyArgs args) {
+  MXCHECK_EQ(args.size(), 1) << "[WordPieceTokenizer::batch_tokenize] Expect 1 arguments but get "
+                             << args.size();
+  MXCHECK(args[0].type_code() == TypeIndex::kRuntimeList)
+      << "[WordPieceTokenizer] unsupported data type: " << args[0].type_name();
+  auto sentences = args[0].AsObjectViewNoCheck<List>().data();
+  List batch_output;
+  batch_output.reserve(sentences.size());
+  for (auto& sentence : sentences) {
+    MXCHECK(sentence.type_code() == TypeIndex::kRuntimeList)
+        << "[WordPieceTokenizer] unsupported data type: List[" << sentence.type_name() << "]";
+    List output_tokens;
+    this->tokenize(sentence.AsObjectViewNoCheck<List>().data(), output_tokens);
+    batch_output.push_back(std::move(output_tokens));
+  }
+  return batch_output;
 }
 
 using text_tokenizer_WordPieceTokenizer = WordPieceTokenizer;
 MATX_REGISTER_NATIVE_OBJECT(text_tokenizer_WordPieceTokenizer)
     .SetConstructor([](PyArgs args) -> std::shared_ptr<void> {
-      MXCHECK_EQ(args.size(), 6) << "[WordPieceTokenizer] Expect 6 arguments but get "
-                                 << args.size();
+      MXCHECK(args.size() >= 6 && args.size() <= 9)
+          << "[WordPieceTokenizer] Expect 6 to 9 arguments but get " << args.size();
       String vocab_path = commons::details::GetString(args[0], __FILE__, __LINE__);
       bool lookup_id = MATXSCRIPT_TYPE_AS(args[1], int64_t);
       const Any& unk_token = args[2];
       String subwords_prefix = commons::details::GetString(args[3], __FILE__, __LINE__);
       bool skip_empty = MATXSCRIPT_TYPE_AS(args[4], int64_t);
       int64_t max_bytes_per_token = MATXSCRIPT_TYPE_AS(args[5], int64_t);
+      bool use_perfect_hash = true;
+      if (args.size() > 6) {
+        use_perfect_hash = MATXSCRIPT_TYPE_AS(args[6], int64_t);
+      }
+      int64_t cache_size = 0;
+      if (args.size() > 7) {
+        cache_size = MATXSCRIPT_TYPE_AS(args[7], int64_t);
+      }
+      String lib_signature;
+      if (args.size() > 8) {
+        lib_signature = commons::details::GetString(args[8], __FILE__, __LINE__);
+      }
       return std::make_shared<WordPieceTokenizer>(std::move(vocab_path),
                                                   lookup_id,
                                                   unk_token,
                                                   subwords_prefix,
                                                   skip_empty,
-                                                  max_bytes_per_token);
+                                                  max_bytes_per_token,
+                                                  use_perfect_hash,
+                                                  cache_size,
+                                                  std::move(lib_signature));
     })
     .RegisterFunction("tokenize",
                       [](void* self, PyArgs args) -> RTValue {
                         return reinterpret_cast<WordPieceTokenizer*>(self)->tokenize(args);
                       })
-    .RegisterFunction("tokenize_with_meta", [](void* self, PyArgs args) -> RTValue {
-      return reinterpret_cast<WordPieceTokenizer*>(self)->tokenize_with_meta(args);
+    .RegisterFunction("tokenize_with_meta",
+                      [](void* self, PyArgs args) -> RTValue {
+                        return reinterpret_cast<WordPieceTokenizer*>(self)->tokenize_with_meta(
+                            args);
+                      })
+    .RegisterFunction("batch_tokenize",
+                      [](void* self, PyArgs args) -> RTValue {
+                        return reinterpret_cast<WordPieceTokenizer*>(self)->batch_tokenize(args);
+                      })
+    .RegisterFunction("tokenize_ids",
+                      [](void* self, PyArgs args) -> RTValue {
+                        return reinterpret_cast<WordPieceTokenizer*>(self)->tokenize_ids(args);
+                      })
+    .RegisterFunction("tokenize_ids_with_meta",
+                      [](void* self, PyArgs args) -> RTValue {
+                        return reinterpret_cast<WordPieceTokenizer*>(self)->tokenize_ids_with_meta(
+                            args);
+                      })
+    .RegisterFunction("stats", [](void* self, PyArgs args) -> RTValue {
+      return reinterpret_cast<WordPieceTokenizer*>(self)->stats(args);
     });
 
 }  // namespace tokenizer